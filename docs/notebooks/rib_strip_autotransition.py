@@ -29,10 +29,12 @@
 # 3. Preferred routing cross-sections defined for the all-angle router.
 
 # %%
-from functools import partial
+from collections.abc import Callable
+from functools import lru_cache, partial, wraps
 
 import gdsfactory as gf
-from gdsfactory.cross_section import xs_rc, strip, rib
+from gdsfactory.cell import component_cache
+from gdsfactory.cross_section import CrossSection, xs_rc, strip, rib
 from gdsfactory.generic_tech import get_generic_pdk
 from gdsfactory.read import cell_from_yaml_template
 from gdsfactory.routing import all_angle
@@ -52,27 +54,44 @@ generic_pdk.layers.update(
     RIB_INTENT_LAYER=RIB_INTENT_LAYER, STRIP_INTENT_LAYER=STRIP_INTENT_LAYER
 )
 
+
+# CrossSections are frozen, so every port and route asking for the same settings
+# (such as the per-width calls in the transitions below) can share one instance.
+# wraps keeps the factory name, so cells using strip or rib get different names
+def intern_cross_section(cross_section_factory: Callable) -> Callable:
+    cached_factory = lru_cache(maxsize=256)(cross_section_factory)
+
+    @wraps(cross_section_factory)
+    def _cross_section(**kwargs) -> CrossSection:
+        try:
+            return cached_factory(**kwargs)
+        except TypeError:  # unhashable settings such as lists are built every time
+            return cross_section_factory(**kwargs)
+
+    return _cross_section
+
+
 # create strip and rib cross-sections, with differentiated intent layers
-strip_with_intent = partial(
-    strip,
-    cladding_layers=[
-        "STRIP_INTENT_LAYER"
-    ],  # keeping WG layer is nice for compatibility
-    cladding_offsets=[0],
-    gap=2,
-)
+# (keeping WG layer is nice for compatibility)
+@intern_cross_section
+def strip_with_intent(**kwargs) -> CrossSection:
+    return strip(
+        cladding_layers=("STRIP_INTENT_LAYER",), cladding_offsets=(0,), gap=2, **kwargs
+    )
 
-rib_with_intent = partial(
-    rib,
-    cladding_layers=["RIB_INTENT_LAYER"],  # keeping WG layer is nice for compatibility
-    cladding_offsets=[0],
-    gap=5,
-)
+
+@intern_cross_section
+def rib_with_intent(**kwargs) -> CrossSection:
+    return rib(
+        cladding_layers=("RIB_INTENT_LAYER",), cladding_offsets=(0,), gap=5, **kwargs
+    )
 
 
 # create strip->rib transition component
-@gf.cell
-def strip_to_rib(width1: float = 0.5, width2: float = 0.5) -> gf.Component:
+# the auto-transitioner only asks for a handful of width pairs, so we build each
+# transition once and hand out copies
+@component_cache(maxsize=128)
+def _strip_to_rib(width1: float, width2: float, absorb: bool) -> gf.Component:
     c = gf.Component()
     taper = c << gf.c.taper_strip_to_ridge(width1=width1, width2=width2)
     c.add_port(
@@ -89,33 +108,62 @@ def strip_to_rib(width1: float = 0.5, width2: float = 0.5) -> gf.Component:
         cross_section=rib_with_intent(width=width2),
         width=width2,
     )
-    c.absorb(taper)
+    # by default keep the taper as a reference: absorbing it copies all its polygons
+    # into every transition, which only pays off if you need flat geometry
+    if absorb:
+        c.absorb(taper)
     c.info.update(taper.info)
     c.add_route_info(cross_section="r2s", length=c.info["length"])
     return c
 
 
+@gf.cell
+def strip_to_rib(
+    width1: float = 0.5, width2: float = 0.5, absorb: bool = False
+) -> gf.Component:
+    c = _strip_to_rib(width1, width2, absorb).copy()
+    # copy shares info with the cached transition, and @gf.cell updates it
+    c.info = dict(c.info)
+    return c
+
+
 # also define a rib->strip component for transitioning the other way
+# this is the same geometry as strip->rib, with the port names swapped
 @gf.cell
-def rib_to_strip(width1: float = 0.5, width2: float = 0.5) -> gf.Component:
-    c = gf.Component()
-    taper = c << strip_to_rib(width1=width2, width2=width1)
-    c.add_port("o1", port=taper.ports["o2"])
-    c.add_port("o2", port=taper.ports["o1"])
-    c.info.update(taper.info)
+def rib_to_strip(
+    width1: float = 0.5, width2: float = 0.5, absorb: bool = False
+) -> gf.Component:
+    c = _strip_to_rib(width2, width1, absorb)
+    c = gf.component.copy(
+        c, ports={"o1": c.ports["o2"].copy("o1"), "o2": c.ports["o1"].copy("o2")}
+    )
+    c.info = dict(c.info)
     return c
 
 
 # create single-layer taper components
-@gf.cell
-def taper_single_cross_section(
-    cross_section: CrossSectionSpec = "xs_sc", width1: float = 0.5, width2: float = 1.0
+# the auto-transitioner requests the same tapers over and over, so we resolve the
+# cross-sections and build each taper only once (get_generic_pdk is already cached)
+@component_cache(maxsize=512)
+def _taper_single_cross_section(
+    cross_section: CrossSectionSpec, width1: float, width2: float
 ) -> gf.Component:
     cs1 = gf.get_cross_section(cross_section, width=width1)
     cs2 = gf.get_cross_section(cross_section, width=width2)
     length = abs(width1 - width2) * 10
-    c = gf.components.taper_cross_section_linear(cs1, cs2, length=length).copy()
-    c.info["length"] = length
+    return gf.components.taper_cross_section_linear(cs1, cs2, length=length)
+
+
+@gf.cell
+def taper_single_cross_section(
+    cross_section: CrossSectionSpec = "xs_sc", width1: float = 0.5, width2: float = 1.0
+) -> gf.Component:
+    width1 = round(width1, 4)
+    width2 = round(width2, 4)
+    c = _taper_single_cross_section(cross_section, width1, width2).copy()
+    # copy shares info with the cached taper, so give this one its own dict
+    c.info = dict(c.info)
+    c.info["length"] = abs(width1 - width2) * 10
     return c
 
 
@@ -177,14 +225,22 @@ c.plot()
 # %%
 from pathlib import Path
 
-from IPython.display import Code, display
+from gdsfactory.cell import remove_from_cache
 
-from gdsfactory.read import cell_from_yaml_template
+_yaml_pic_mtimes = {}
 
 
 def show_yaml_pic(filepath):
-    gf.clear_cache()
-    cell_name = filepath.stem
+    # IPython is only needed to display the yaml, so importing this file stays cheap
+    from IPython.display import Code, display
+
+    cell_name = filepath.stem.split(".")[0]
+    # only drop the cells built from this yaml, and only when the file changed,
+    # so all the other components stay cached across the notebook
+    mtime = filepath.stat().st_mtime_ns
+    if _yaml_pic_mtimes.get(filepath) != mtime:
+        remove_from_cache(cell_name)
+        _yaml_pic_mtimes[filepath] = mtime
     return display(
         Code(filename=filepath, language="yaml+jinja"),
         cell_from_yaml_template(filepath, name=cell_name)(),
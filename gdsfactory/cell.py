@@ -18,6 +18,7 @@ from gdsfactory.name import clean_name, get_name_short
 from gdsfactory.serialization import clean_dict, clean_value_name
 
 CACHE: dict[str, Component] = {}
+_COMPONENT_CACHES: list[Callable] = []
 
 INFO_VERSION = 2
 
@@ -34,6 +35,38 @@ def clear_cache() -> None:
 
     CACHE = {}
     name_counters.clear()
+    for cached_function in _COMPONENT_CACHES:
+        cached_function.cache_clear()
+
+
+def remove_from_cache(prefix: str) -> None:
+    """Removes Components whose name starts with prefix from CACHE.
+
+    Unlike clear_cache, it keeps every other cached Component.
+
+    Args:
+        prefix: name prefix of the Components to remove.
+    """
+    for name in [name for name in CACHE if name.startswith(prefix)]:
+        CACHE.pop(name)
+
+
+def component_cache(maxsize: int | None = 128) -> Callable[[_F], _F]:
+    """Returns an lru_cache decorator that is also cleared by clear_cache.
+
+    Use it for helper functions that return Components (or objects derived from
+    Components) so they never outlive the Component CACHE.
+
+    Args:
+        maxsize: maximum number of cached results. None for unbounded.
+    """
+
+    def decorator(func: _F) -> _F:
+        cached_function = functools.lru_cache(maxsize=maxsize)(func)
+        _COMPONENT_CACHES.append(cached_function)
+        return cached_function
+
+    return decorator
 
 
 def print_cache() -> None:
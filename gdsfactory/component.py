@@ -13,7 +13,7 @@ import pathlib
 import uuid
 import warnings
 from collections import Counter
-from collections.abc import Callable, Iterable, Mapping
+from collections.abc import Callable, Iterable, Mapping, Sequence
 from copy import deepcopy
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Literal
@@ -985,6 +985,94 @@ class Component(_GeometryHelper):
             name = f"{prefix}{port.name}{suffix}"
             self.add_port(name=name, port=port, **kwargs)
 
+    def add_ports_bulk(
+        self,
+        names: Iterable[str],
+        centers: Iterable[tuple[float, float]],
+        widths: Iterable[float],
+        orientations: Iterable[float],
+        layers: Iterable[tuple[int, int]],
+        port_type: str | Iterable[str] = "optical",
+        cross_sections: Iterable[CrossSectionSpec | None] | None = None,
+        shear_angles: Iterable[float | None] | None = None,
+    ) -> list[Port]:
+        """Add many ports at once from per-port attribute sequences.
+
+        Centers are snapped to grid and orientations wrapped to [0, 360) in one
+        numpy pass. Unlike add_port, layers and widths are not validated,
+        so it is meant for trusted callers with ports that were already checked.
+        Layer specs are not resolved and port info is not set,
+        so copying ports that carry info needs add_ports instead.
+
+        Args:
+            names: port names.
+            centers: x, y for each port.
+            widths: in um.
+            orientations: in deg.
+            layers: resolved (layer, datatype) for each port.
+            port_type: for all ports, or one for each port.
+            cross_sections: optional cross_section for each port.
+            shear_angles: optional shear_angle for each port.
+        """
+        names = list(names)
+        centers = np.asarray(centers, dtype="float64").reshape(-1, 2)
+        if CONF.enforce_ports_on_grid:
+            centers = snap_to_grid(centers)
+        orientations = np.mod(np.asarray(orientations, dtype="float64"), 360)
+        port_types = (
+            itertools.repeat(port_type) if isinstance(port_type, str) else port_type
+        )
+        cross_sections = (
+            itertools.repeat(None) if cross_sections is None else cross_sections
+        )
+        shear_angles = itertools.repeat(None) if shear_angles is None else shear_angles
+
+        repeated = [name for name, count in Counter(names).items() if count > 1]
+        if repeated:
+            raise ValueError(f"add_ports_bulk() Port names {repeated} are repeated")
+
+        existing = sorted(set(names).intersection(self.ports))
+        if existing:
+            raise ValueError(
+                f"add_ports_bulk() Port names {existing} exist in {self.name!r}"
+            )
+
+        ports = [
+            Port(
+                name=name,
+                center=center,
+                width=width,
+                orientation=orientation,
+                layer=tuple(layer),
+                port_type=port_type,
+                parent=self,
+                cross_section=cross_section,
+                shear_angle=shear_angle,
+                enforce_ports_on_grid=False,
+            )
+            for (
+                name,
+                center,
+                width,
+                orientation,
+                layer,
+                port_type,
+                cross_section,
+                shear_angle,
+            ) in zip(
+                names,
+                centers,
+                widths,
+                orientations.tolist(),
+                layers,
+                port_types,
+                cross_sections,
+                shear_angles,
+            )
+        ]
+        self.ports.update((port.name, port) for port in ports)
+        return ports
+
     def snap_ports_to_grid(self, grid_factor: int = 1) -> None:
         for port in self.ports.values():
             port.snap_to_grid(grid_factor=grid_factor)
@@ -1404,6 +1492,52 @@ class Component(_GeometryHelper):
         self._register_reference(reference=ref, alias=alias)
         return ref
 
+    def add_refs(
+        self,
+        components: Sequence[Component],
+        origins: Sequence[Coordinate] | None = None,
+        **kwargs,
+    ) -> list[ComponentReference]:
+        """Add several ComponentReferences to the current Component at once.
+
+        Checks the lock once and inserts all the references into the cell
+        in a single call.
+
+        Args:
+            components: list of Components to reference.
+            origins: optional position of each reference. Defaults to (0, 0).
+
+        Keyword Args:
+            shared by all references (rotation, magnification, x_reflection).
+
+        .. code::
+
+            c1, c2 = c.add_refs([via, via], origins=[(-10, 0), (10, 0)])
+
+        """
+        components = list(components)
+        for component in components:
+            if not isinstance(component, Component):
+                raise TypeError(f"type = {type(component)} needs to be a Component.")
+
+        if origins is None:
+            origins = [(0, 0)] * len(components)
+        elif len(origins) != len(components):
+            raise ValueError(
+                f"got {len(origins)} origins for {len(components)} components."
+            )
+
+        self.is_unlocked()
+        refs = [
+            ComponentReference(component, origin=origin, **kwargs)
+            for component, origin in zip(components, origins)
+        ]
+        self._cell.add(*[ref._reference for ref in refs])
+        self._references.extend(refs)
+        for ref in refs:
+            self._register_reference(reference=ref)
+        return refs
+
     def _register_reference(
         self, reference: ComponentReference, alias: str | None = None
     ) -> None:
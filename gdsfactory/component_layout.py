@@ -188,6 +188,8 @@ class _GeometryHelper:
     the bounding box such that its maximum x value is 5.2 (self.xmax = 5.2).
     """
 
+    __slots__ = ()
+
     @property
     def center(self):
         """Returns the center of the bounding box."""
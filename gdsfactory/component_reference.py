@@ -146,6 +146,17 @@ class ComponentReference(_GeometryHelper):
 
     """
 
+    __slots__ = (
+        "_reference",
+        "_ref_cell",
+        "_owner",
+        "_name",
+        "_local_ports",
+        "_bb_valid",
+        "visual_label",
+        "__dict__",  # keeps ad-hoc attributes on references working
+    )
+
     def __init__(
         self,
         component: Component,
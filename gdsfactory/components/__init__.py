@@ -232,7 +232,10 @@ from gdsfactory.components.ring import ring
 from gdsfactory.components.ring_crow import ring_crow
 from gdsfactory.components.ring_crow_couplers import ring_crow_couplers
 from gdsfactory.components.ring_double import ring_double
-from gdsfactory.components.ring_double_heater import ring_double_heater
+from gdsfactory.components.ring_double_heater import (
+    ring_double_heater,
+    ring_double_heater_array,
+)
 from gdsfactory.components.ring_double_pn import ring_double_pn
 from gdsfactory.components.ring_section_based import ring_section_based
 from gdsfactory.components.ring_single import ring_single
@@ -535,6 +538,7 @@ __all__ = [
     "ring_crow_couplers",
     "ring_double",
     "ring_double_heater",
+    "ring_double_heater_array",
     "ring_double_pn",
     "ring_double_trenches",
     "ring_section_based",
@@ -1,18 +1,92 @@
 from __future__ import annotations
 
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from functools import partial
 
+import numpy as np
+
 import gdsfactory as gf
+from gdsfactory.cell import component_cache
 from gdsfactory.component import Component
 from gdsfactory.components.bend_euler import bend_euler
 from gdsfactory.components.coupler_ring import coupler_ring
 from gdsfactory.components.straight import straight
 from gdsfactory.components.via_stack import via_stack_heater_m3
-from gdsfactory.typings import ComponentFactory, ComponentSpec, CrossSectionSpec, Float2
+from gdsfactory.config import CONF
+from gdsfactory.port import Port
+from gdsfactory.typings import (
+    ComponentFactory,
+    ComponentSpec,
+    CrossSectionSpec,
+    Float2,
+    Floats,
+)
 
+# kept as a spec so the via is built for the active PDK, and only once per PDK
 via_stack_heater_m3_mini = partial(via_stack_heater_m3, size=(4, 4))
 
 
+@component_cache(maxsize=256)
+def _get_component_cached(
+    component: ComponentSpec, key: tuple[str, ...], **kwargs
+) -> Component:
+    return gf.get_component(component, **kwargs)
+
+
+def _get_component(
+    component: ComponentSpec, cross_sections: tuple[CrossSectionSpec, ...], **kwargs
+) -> Component:
+    """Returns component from a spec, reusing it for repeated settings.
+
+    The cache key includes the active PDK and the resolved cross_sections,
+    so the same spec resolving to a different CrossSection is rebuilt.
+    Unhashable specs (CrossSection or dict) skip the cache.
+
+    Args:
+        component: component spec.
+        cross_sections: cross_section specs that component depends on.
+        kwargs: component settings.
+    """
+    try:
+        hash((component, cross_sections, tuple(kwargs.items())))
+    except TypeError:
+        return gf.get_component(component, **kwargs)
+
+    pdk = gf.get_active_pdk()
+    key = (pdk.name,) + tuple(pdk.get_cross_section(xs).name for xs in cross_sections)
+    return _get_component_cached(component, key, **kwargs)
+
+
+@component_cache(maxsize=256)
+def _get_xbounds(component: Component) -> tuple[float, float]:
+    """Returns xmin, xmax of a cached component, which is locked and won't change."""
+    return component.xmin, component.xmax
+
+
+@component_cache(maxsize=256)
+def _get_ports_list(
+    component: Component, orientation: float | None
+) -> tuple[Port, ...]:
+    """Returns the ports of a cached component filtered by orientation."""
+    return tuple(component.get_ports_list(orientation=orientation))
+
+
+def _build_components(builders: list[Callable[[], Component]]) -> list[Component]:
+    """Returns the components from builders.
+
+    Builds them in threads when CONF.parallel_build is True
+    (environment variable GDSFACTORY_PARALLEL_BUILD=1).
+    This only pays off if the component factories release the GIL.
+    """
+    if not CONF.parallel_build or len(builders) < 2:
+        return [build() for build in builders]
+
+    with ThreadPoolExecutor(max_workers=len(builders)) as executor:
+        futures = [executor.submit(build) for build in builders]
+        return [future.result() for future in futures]
+
+
 @gf.cell
 def ring_double_heater(
     gap: float = 0.2,
@@ -65,16 +139,8 @@ def ring_double_heater(
 
     coupler_ring_top = coupler_ring_top or coupler_ring
 
-    coupler_component = coupler_ring(
-        gap=gap,
-        radius=radius,
-        length_x=length_x,
-        bend=bend,
-        cross_section=cross_section,
-        cross_section_bend=cross_section_waveguide_heater,
-    )
-    coupler_component_top = gf.get_component(
-        coupler_ring_top,
+    cross_sections = (cross_section, cross_section_waveguide_heater)
+    coupler_settings = dict(
         gap=gap,
         radius=radius,
         length_x=length_x,
@@ -82,10 +148,26 @@ def ring_double_heater(
         cross_section=cross_section,
         cross_section_bend=cross_section_waveguide_heater,
     )
-    straight_component = straight(
-        length=length_y,
-        cross_section=cross_section_waveguide_heater,
-    )
+
+    builders = [
+        partial(_get_component, coupler_ring, cross_sections, **coupler_settings),
+        partial(
+            _get_component,
+            straight,
+            cross_sections,
+            length=length_y,
+            cross_section=cross_section_waveguide_heater,
+        ),
+    ]
+    if coupler_ring_top is not coupler_ring:
+        builders.append(
+            partial(
+                _get_component, coupler_ring_top, cross_sections, **coupler_settings
+            )
+        )
+
+    coupler_component, straight_component, *top = _build_components(builders)
+    coupler_component_top = top[0] if top else coupler_component
 
     c = Component()
     cb = c.add_ref(coupler_component)
@@ -101,25 +183,38 @@ def ring_double_heater(
     c.add_port("o3", port=ct.ports["o4"])
     c.add_port("o4", port=ct.ports["o1"])
 
-    via = gf.get_component(via_stack)
-    c1 = c << via
-    c2 = c << via
-    c1.xmax = -length_x / 2 + cb.x - via_stack_offset[0]
-    c2.xmin = +length_x / 2 + cb.x + via_stack_offset[0]
-    c1.movey(via_stack_offset[1])
-    c2.movey(via_stack_offset[1])
+    via = _get_component(via_stack, ())
+    via_xmin, via_xmax = _get_xbounds(via)
+    x0 = cb.x
+    c1, c2 = c.add_refs(
+        [via, via],
+        origins=[
+            (-length_x / 2 + x0 - via_stack_offset[0] - via_xmax, via_stack_offset[1]),
+            (+length_x / 2 + x0 + via_stack_offset[0] - via_xmin, via_stack_offset[1]),
+        ],
+    )
 
-    p1 = c1.get_ports_list(orientation=port_orientation)
-    p2 = c2.get_ports_list(orientation=port_orientation)
-    valid_orientations = {p.orientation for p in via.ports.values()}
+    # both via references are plain translations of via, so their ports are the
+    # filtered via ports shifted by each reference origin
+    via_ports = _get_ports_list(via, port_orientation)
 
-    if not p1:
+    if not via_ports:
+        valid_orientations = {p.orientation for p in via.ports.values()}
         raise ValueError(
             f"No ports found for port_orientation {port_orientation} in {valid_orientations}"
         )
 
-    c.add_ports(p1, prefix="l_")
-    c.add_ports(p2, prefix="r_")
+    via_centers = np.array([p.center for p in via_ports])
+    c.add_ports_bulk(
+        names=[f"l_{p.name}" for p in via_ports] + [f"r_{p.name}" for p in via_ports],
+        centers=np.concatenate([via_centers + c1.origin, via_centers + c2.origin]),
+        widths=[p.width for p in via_ports] * 2,
+        orientations=[p.orientation for p in via_ports] * 2,
+        layers=[p.layer for p in via_ports] * 2,
+        port_type=[p.port_type for p in via_ports] * 2,
+        cross_sections=[p.cross_section for p in via_ports] * 2,
+        shear_angles=[p.shear_angle for p in via_ports] * 2,
+    )
 
     heater_top = c << straight(
         length=length_x,
@@ -129,6 +224,72 @@ def ring_double_heater(
     return c
 
 
+@gf.cell
+def ring_double_heater_array(
+    gaps: Floats = (0.2, 0.3),
+    radius: float | Floats = 10.0,
+    length_x: float | Floats = 1.0,
+    length_y: float | Floats = 0.01,
+    spacing: float = 10.0,
+    ring: ComponentSpec = ring_double_heater,
+    **kwargs,
+) -> Component:
+    """Returns a row of double bus rings with heater, one ring per gap.
+
+    radius, length_x and length_y are broadcast against gaps,
+    and all gaps are snapped to grid at once.
+    Port names get the ring index as suffix (o1_1, o1_2 ...).
+
+    Args:
+        gaps: gap for each ring coupler.
+        radius: for the bend and coupler. Scalar or one per gap.
+        length_x: ring coupler length. Scalar or one per gap.
+        length_y: vertical straight length. Scalar or one per gap.
+        spacing: between the bounding boxes of neighbouring rings.
+        ring: ring spec.
+
+    Keyword Args:
+        ring settings.
+
+    .. code::
+
+         --==ct==--            --==ct==--
+          |      |              |      |
+          |      |   spacing    |      |
+          |      |              |      |
+         --==cb==-- gaps[0]    --==cb==-- gaps[1]
+    """
+    gaps, radius, length_x, length_y = np.broadcast_arrays(
+        gaps, radius, length_x, length_y
+    )
+    gaps = gf.snap.snap_to_grid(gaps, grid_factor=2)
+
+    rings = [
+        gf.get_component(
+            ring,
+            gap=gap,
+            radius=radius_i,
+            length_x=length_x_i,
+            length_y=length_y_i,
+            **kwargs,
+        )
+        for gap, radius_i, length_x_i, length_y_i in zip(
+            gaps.tolist(), radius.tolist(), length_x.tolist(), length_y.tolist()
+        )
+    ]
+
+    # place each ring so its bbox starts where the previous one ended plus spacing
+    pitch = np.array([component.xsize for component in rings]) + spacing
+    xmin = np.array([component.xmin for component in rings])
+    x = np.cumsum(pitch) - pitch - xmin
+
+    c = Component()
+    for i, (component, xi) in enumerate(zip(rings, x.tolist()), start=1):
+        ref = c.add_ref(component, origin=(xi, 0))
+        c.add_ports(ref.ports, suffix=f"_{i}")
+    return c
+
+
 if __name__ == "__main__":
     c = ring_double_heater()
     c.show()
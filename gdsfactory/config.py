@@ -190,6 +190,7 @@ class Settings(BaseSettings):
         loglevel: Log level.
         pdk: PDK to use. Defaults to generic.
         difftest_ignore_cell_name_differences: Ignore cell name differences in difftest.
+        parallel_build: Build independent sub-components in threads, where supported.
     """
 
     n_threads: int = get_number_of_cores()
@@ -214,6 +215,7 @@ class Settings(BaseSettings):
     )
     enforce_ports_on_grid: bool = True
     bend_radius_error_type: ErrorType = ErrorType.WARNING
+    parallel_build: bool = False
 
     @classmethod
     def from_config(cls) -> Settings:
@@ -1,16 +1,29 @@
+import hashlib
 import pathlib
 from collections.abc import Callable, Iterable
+from functools import partial, wraps
 from inspect import Parameter, Signature, signature
 from io import IOBase
 from typing import IO, Any
 
+import gdstk
 import jinja2
+import orjson
 import yaml
 
+from gdsfactory.cell import component_cache
 from gdsfactory.component import Component
+from gdsfactory.config import logger
+
+try:
+    import minijinja
+except ImportError:
+    minijinja = None
 
 __all__ = ["cell_from_yaml_template"]
 
+_TEMPLATE_CACHE: dict[pathlib.Path, tuple[int, Callable[..., str], dict[str, Any]]] = {}
+
 
 def split_default_settings_from_yaml(yaml_lines: Iterable[str]) -> tuple[str, str]:
     """Separates out the 'default_settings' block from the rest of the file body.
@@ -61,17 +74,62 @@ def _split_yaml_definition(subpic_yaml):
     return main_file, default_settings
 
 
+def _compile_template(main_file: str) -> Callable[..., str]:
+    """Returns a function that renders the compiled yaml template with settings."""
+    if minijinja is not None:
+        env = minijinja.Environment(templates={"main": main_file})
+        return partial(env.render_template, "main")
+    return jinja2.Template(main_file).render
+
+
+def _get_yaml_template(
+    yaml_definition: str | IO[Any] | pathlib.Path,
+) -> tuple[Callable[..., str], dict[str, Any]]:
+    """Returns the compiled template and the default settings of a yaml definition.
+
+    Files are cached by path and modification time, so editing a file invalidates
+    its cache entry.
+
+    Args:
+        yaml_definition: the filepath or file object of the pic yaml template.
+    """
+    if isinstance(yaml_definition, IOBase):
+        main_file, default_settings = _split_yaml_definition(yaml_definition)
+        return _compile_template(main_file), default_settings
+
+    path = pathlib.Path(yaml_definition).resolve()
+    mtime = path.stat().st_mtime_ns
+    cached = _TEMPLATE_CACHE.get(path)
+    if cached and cached[0] == mtime:
+        return cached[1], cached[2]
+
+    main_file, default_settings = _split_yaml_definition(path)
+    template = _compile_template(main_file)
+    _TEMPLATE_CACHE[path] = (mtime, template, default_settings)
+    return template, default_settings
+
+
 def cell_from_yaml_template(
     filename: str | IO[Any] | pathlib.Path,
     name: str,
     routing_strategy: dict[str, Callable] | None = None,
+    cache_dir: str | pathlib.Path | None = None,
 ) -> Callable:
     """Gets a PIC factory function from a yaml definition, which can optionally be a jinja template.
 
+    Renders templates with minijinja when it is installed, which is much faster
+    than jinja2.
+
     Args:
         filename: the filepath of the pic yaml template.
         name: the name of the component to create.
         routing_strategy: a dictionary of routing functions.
+        cache_dir: optional directory to cache the built components as GDS,
+            keyed by template contents, name, routing_strategy, settings,
+            gdsfactory version and PDK name.
+            Skips rendering and routing when the same component was built before,
+            loading it flattened with its ports (info and settings are not kept).
+            Changes in the PDK code are not detected, so clear the directory after those.
 
     Returns:
          a factory function for the component.
@@ -81,7 +139,10 @@ def cell_from_yaml_template(
     if routing_strategy is None:
         routing_strategy = get_routing_strategies()
     return yaml_cell(
-        yaml_definition=filename, name=name, routing_strategy=routing_strategy
+        yaml_definition=filename,
+        name=name,
+        routing_strategy=routing_strategy,
+        cache_dir=cache_dir,
     )
 
 
@@ -101,24 +162,28 @@ def get_default_settings_dict(default_settings):
     return settings
 
 
-def yaml_cell(yaml_definition, name: str, routing_strategy) -> Callable[..., Component]:
+def yaml_cell(
+    yaml_definition, name: str, routing_strategy, cache_dir=None
+) -> Callable[..., Component]:
     """The "cell" decorator equivalent for yaml files. Generates a proper cell function for yaml-defined circuits.
 
     Args:
         yaml_definition: the filename to the pic yaml definition.
         name: the name of the pic to create.
         routing_strategy: a dictionary of routing strategies to use for pic generation.
+        cache_dir: optional directory to cache the built components as GDS.
+            Ignored for file objects.
 
     Returns:
         a dynamically-generated function for the yaml file.
     """
     from gdsfactory.cell import cell_without_validator
 
-    yaml_body, default_settings_def = _split_yaml_definition(yaml_definition)
+    template, default_settings_def = _get_yaml_template(yaml_definition)
     default_settings = get_default_settings_dict(default_settings_def)
 
     def _yaml_func(**kwargs):
-        evaluated_text = _evaluate_yaml_template(yaml_body, default_settings, kwargs)
+        evaluated_text = _evaluate_yaml_template(template, default_settings, kwargs)
         return _pic_from_templated_yaml(evaluated_text, name, routing_strategy)
 
     sig = signature(_yaml_func)
@@ -146,14 +211,97 @@ def yaml_cell(yaml_definition, name: str, routing_strategy) -> Callable[..., Com
     _yaml_func.__module__ = "yaml_jinja"
     _yaml_func.__signature__ = new_sig
     _yaml_func.__doc__ = docstring
-    return cell_without_validator(_yaml_func)
+    cell_func = cell_without_validator(_yaml_func)
+
+    if cache_dir is None or isinstance(yaml_definition, IOBase):
+        return cell_func
+
+    cache_dir = pathlib.Path(cache_dir)
+    source = pathlib.Path(yaml_definition).read_bytes()
+
+    @wraps(cell_func)
+    def _cached_cell_func(**kwargs) -> Component:
+        key = _get_cache_key(source, name, routing_strategy, kwargs)
+        gdspath = cache_dir / f"{key}.gds"
+        portspath = gdspath.with_suffix(".json")
+        if portspath.exists():
+            try:
+                return _load_cached_component(gdspath)
+            except Exception as e:
+                # a truncated or stale entry is rebuilt instead of failing every call
+                logger.warning(f"Rebuilding {name!r}, cannot load {gdspath}: {e}")
+                gdspath.unlink(missing_ok=True)
+                portspath.unlink(missing_ok=True)
+
+        component = cell_func(**kwargs)
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        component.write_gds(gdspath, logging=False)
+        # written last, so an entry only counts once its GDS is complete
+        metadata = dict(
+            name=component.name, ports=[p.to_dict() for p in component.ports.values()]
+        )
+        portspath.write_bytes(orjson.dumps(metadata))
+        return component
+
+    return _cached_cell_func
+
+
+def _get_cache_key(
+    source: bytes,
+    name: str,
+    routing_strategy: dict[str, Callable],
+    settings: dict[str, Any],
+) -> str:
+    """Returns a hash of the yaml source, name, routing strategies and settings.
+
+    Settings are serialized with clean_value_json, so the key stays the same
+    across sessions. Also includes the gdsfactory version and the PDK name.
+    """
+    from gdsfactory.config import __version__
+    from gdsfactory.pdk import get_active_pdk
+    from gdsfactory.serialization import clean_value_json
+
+    d = clean_value_json(
+        dict(name=name, routing_strategy=routing_strategy, settings=settings)
+    )
+    h = hashlib.sha256(source)
+    h.update(orjson.dumps(d, option=orjson.OPT_SORT_KEYS))
+    h.update(f"{__version__}_{get_active_pdk().name}".encode())
+    return h.hexdigest()[:16]
+
+
+@component_cache(maxsize=128)
+def _load_cached_component(gdspath: pathlib.Path) -> Component:
+    """Returns a component from a cached GDS and its ports sidecar.
+
+    The cell is flattened, so the subcells don't register names that belong
+    to the PCells that built them.
+    """
+    metadata = orjson.loads(gdspath.with_suffix(".json").read_bytes())
+    (top,) = gdstk.read_gds(str(gdspath)).top_level()
+    top.flatten()
+
+    c = Component(name=metadata["name"])
+    c._cell.add(*top.polygons, *top.paths, *top.labels)
+    for port in metadata["ports"]:
+        c.add_port(
+            name=port["name"],
+            center=port["center"],
+            width=port["width"],
+            orientation=port["orientation"],
+            layer=tuple(port["layer"]),
+            port_type=port["port_type"],
+            shear_angle=port["shear_angle"],
+        )
+    c.imported_gds = True
+    c.lock()
+    return c
 
 
-def _evaluate_yaml_template(main_file, default_settings, settings):
-    template = jinja2.Template(main_file)
+def _evaluate_yaml_template(template, default_settings, settings):
     complete_settings = dict(default_settings)
     complete_settings.update(settings)
-    return template.render(**complete_settings)
+    return template(**complete_settings)
 
 
 def _pic_from_templated_yaml(evaluated_text, name, routing_strategy) -> Component:
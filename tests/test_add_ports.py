@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import pytest
+
 import gdsfactory as gf
 from gdsfactory.add_pins import add_pins, add_pins_siepic
 from gdsfactory.add_ports import (
@@ -44,6 +46,36 @@ def test_add_ports_from_pins_siepic(data_regression) -> None:
         data_regression.check(d)
 
 
+def test_add_ports_bulk() -> None:
+    c = gf.Component()
+    ports = c.add_ports_bulk(
+        names=["e1", "e2"],
+        centers=[(0, 0), (10.0004, 0)],
+        widths=[2, 2],
+        orientations=[-90, 450],
+        layers=[(49, 0), (49, 0)],
+        port_type="electrical",
+    )
+    assert list(c.ports) == ["e1", "e2"]
+    assert ports[1].center[0] == 10.0
+    assert [p.orientation for p in ports] == [270, 90]
+    assert ports[0].port_type == "electrical"
+    assert ports[0].cross_section is None
+
+    xs = gf.cross_section.metal3()
+    (port,) = c.add_ports_bulk(
+        ["e3"], [(0, 0)], [10], [0], [(49, 0)], cross_sections=[xs], shear_angles=[5]
+    )
+    assert port.cross_section is xs
+    assert port.shear_angle == 5
+
+    with pytest.raises(ValueError, match="exist in"):
+        c.add_ports_bulk(["e1"], [(0, 0)], [1], [0], [(1, 0)])
+
+    with pytest.raises(ValueError, match="are repeated"):
+        c.add_ports_bulk(["e3", "e3"], [(0, 0)] * 2, [1] * 2, [0] * 2, [(1, 0)] * 2)
+
+
 if __name__ == "__main__":
     # test_add_ports_list()
     # test_add_ports_dict()
@@ -1,3 +1,4 @@
+import os
 from pathlib import Path
 
 import gdsfactory as gf
@@ -32,3 +33,100 @@ def test_cache_name_yaml() -> None:
 
     assert c3.name == "test_pcell"
     assert c3 is c4
+
+
+def test_cache_yaml_template_mtime(tmp_path: Path) -> None:
+    from gdsfactory.read.from_yaml_template import _get_yaml_template
+
+    filepath = tmp_path / "pcell.pic.yml"
+    filepath.write_text("name: {{ name }}\n")
+    template1, _ = _get_yaml_template(filepath)
+    template2, _ = _get_yaml_template(filepath)
+    assert template1 is template2
+
+    filepath.write_text("name: new_{{ name }}\n")
+    mtime_ns = filepath.stat().st_mtime_ns + 1_000_000_000
+    os.utime(filepath, ns=(mtime_ns, mtime_ns))
+    template3, _ = _get_yaml_template(filepath)
+    assert template3 is not template1
+    assert template3(name="a").strip() == "name: new_a"
+
+
+def test_cache_yaml_template_cache_dir(tmp_path: Path) -> None:
+    from gdsfactory.read import cell_from_yaml_template
+
+    filepath = _test_yaml_dir / "test_pcell.pic.yml"
+    c1 = cell_from_yaml_template(filepath, name="test_pcell", cache_dir=tmp_path)()
+    assert len(list(tmp_path.glob("*.gds"))) == 1
+
+    gf.clear_cache()
+    c2 = cell_from_yaml_template(filepath, name="test_pcell", cache_dir=tmp_path)()
+    assert hasattr(c2, "imported_gds")
+    assert c2.name == c1.name
+    assert list(c2.ports) == list(c1.ports)
+    assert gf.components.straight(length=10).name == "straight_length10"
+
+
+def test_cache_yaml_template_cache_dir_name(tmp_path: Path) -> None:
+    from gdsfactory.read import cell_from_yaml_template
+
+    filepath = _test_yaml_dir / "test_pcell.pic.yml"
+    c1 = cell_from_yaml_template(filepath, name="alpha", cache_dir=tmp_path)()
+    c2 = cell_from_yaml_template(filepath, name="beta", cache_dir=tmp_path)()
+    assert c1.name != c2.name
+    assert len(list(tmp_path.glob("*.gds"))) == 2
+
+    gf.clear_cache()
+    c3 = cell_from_yaml_template(filepath, name="beta", cache_dir=tmp_path)()
+    assert c3.name == c2.name
+    assert len(list(tmp_path.glob("*.gds"))) == 2
+
+
+def test_cache_yaml_template_cache_dir_routed(tmp_path: Path) -> None:
+    from gdsfactory.read import cell_from_yaml_template
+
+    filepath = gf.PATH.module / "samples" / "demo" / "circuits" / "mask.pic.yml"
+    c1 = cell_from_yaml_template(filepath, name="mask", cache_dir=tmp_path)()
+
+    gf.clear_cache()
+    c2 = cell_from_yaml_template(filepath, name="mask", cache_dir=tmp_path)()
+    assert hasattr(c2, "imported_gds")
+    assert c2.name == c1.name
+    assert c2.hash_geometry() == c1.hash_geometry()
+    assert {p.name: p.to_dict() for p in c2.ports.values()} == {
+        p.name: p.to_dict() for p in c1.ports.values()
+    }
+
+    gf.clear_cache()
+    gdspath = next(tmp_path.glob("*.gds"))
+    gdspath.write_bytes(b"")
+    c3 = cell_from_yaml_template(filepath, name="mask", cache_dir=tmp_path)()
+    assert not hasattr(c3, "imported_gds")
+    assert gdspath.stat().st_size > 0
+
+
+def test_cache_ring_double_heater_via_stack_per_pdk() -> None:
+    from gdsfactory.components.ring_double_heater import _get_component
+
+    calls = []
+
+    def via_stack() -> gf.Component:
+        calls.append(1)
+        return gf.Component()
+
+    pdk = gf.get_active_pdk()
+    assert _get_component(via_stack, ()) is _get_component(via_stack, ())
+    assert len(calls) == 1
+
+    other_pdk = gf.Pdk(
+        name="other_pdk",
+        cells=pdk.cells,
+        cross_sections=pdk.cross_sections,
+        layers=pdk.layers,
+    )
+    try:
+        other_pdk.activate()
+        _get_component(via_stack, ())
+        assert len(calls) == 2
+    finally:
+        pdk.activate()
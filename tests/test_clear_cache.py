@@ -1,4 +1,5 @@
 import gdsfactory as gf
+from gdsfactory.cell import component_cache, remove_from_cache
 
 
 def test_clear_cache() -> None:
@@ -6,3 +7,27 @@ def test_clear_cache() -> None:
     gf.clear_cache()
     c2 = gf.c.straight()
     assert c1.name == c2.name
+
+
+def test_clear_cache_component_cache() -> None:
+    calls = []
+
+    @component_cache()
+    def double(x: int) -> int:
+        calls.append(x)
+        return 2 * x
+
+    double(1)
+    double(1)
+    assert calls == [1]
+    gf.clear_cache()
+    double(1)
+    assert calls == [1, 1]
+
+
+def test_remove_from_cache() -> None:
+    c1 = gf.c.straight(length=11)
+    c2 = gf.c.bend_circular()
+    remove_from_cache("straight")
+    assert gf.c.straight(length=11) is not c1
+    assert gf.c.bend_circular() is c2
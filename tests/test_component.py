@@ -89,5 +89,19 @@ def test_import_gds_settings() -> None:
     assert c3
 
 
+def test_add_refs() -> None:
+    c = gf.Component()
+    via = gf.components.via_stack()
+    r1, r2 = c.add_refs([via, via], origins=[(-10, 0), (10, 0)])
+    assert c.references == [r1, r2]
+    assert r1.origin == (-10, 0)
+    assert r2.origin == (10, 0)
+    assert r1.name != r2.name
+    assert c.named_references[r2.name] is r2
+
+    with pytest.raises(ValueError):
+        c.add_refs([via, via], origins=[(0, 0)])
+
+
 if __name__ == "__main__":
     test_extract()
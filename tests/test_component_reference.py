@@ -57,3 +57,10 @@ def test_rotation_of_ports_with_no_orientation():
         pt.ports["e11"], pb.ports["e11"], bend="wire_corner"
     )
     c.add(route.references)
+
+
+def test_reference_custom_attribute() -> None:
+    c = gf.Component()
+    ref = c << gf.components.straight()
+    ref.foo = 1
+    assert ref.foo == 1
@@ -0,0 +1,14 @@
+from __future__ import annotations
+
+import gdsfactory as gf
+from gdsfactory.read import cell_from_yaml_template
+
+
+def test_cell_from_yaml_template_mask() -> None:
+    filepath = gf.PATH.module / "samples" / "demo" / "circuits"
+    c = cell_from_yaml_template(filepath / "mask.pic.yml", name="mask")()
+    assert c.references
+
+
+if __name__ == "__main__":
+    test_cell_from_yaml_template_mask()
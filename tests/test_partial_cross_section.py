@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from functools import partial
+from functools import lru_cache, partial
 
 import gdsfactory as gf
 
@@ -13,6 +13,36 @@ def test_partial_cross_section() -> None:
     assert c200.name != c400.name, f"{c200.name} {c400.name}"
 
 
+def test_partial_cross_section_strip_rib() -> None:
+    strip_with_intent = partial(
+        gf.cross_section.strip, cladding_layers=((2001, 11),), cladding_offsets=(0,)
+    )
+    rib_with_intent = partial(
+        gf.cross_section.rib, cladding_layers=((2000, 11),), cladding_offsets=(0,)
+    )
+    c1 = gf.components.straight(cross_section=strip_with_intent)
+    c2 = gf.components.straight(cross_section=rib_with_intent)
+    assert c1.name != c2.name, f"{c1.name} {c2.name}"
+
+    c3 = gf.components.straight(cross_section=strip_with_intent())
+    c4 = gf.components.straight(cross_section=rib_with_intent())
+    assert c3.name != c4.name, f"{c3.name} {c4.name}"
+
+    # named cached factories serialize by their function name
+    @lru_cache
+    def strip_cached(**kwargs) -> gf.CrossSection:
+        return strip_with_intent(**kwargs)
+
+    @lru_cache
+    def rib_cached(**kwargs) -> gf.CrossSection:
+        return rib_with_intent(**kwargs)
+
+    assert strip_cached(width=1) is strip_cached(width=1)
+    c5 = gf.components.straight(cross_section=strip_cached)
+    c6 = gf.components.straight(cross_section=rib_cached)
+    assert c5.name != c6.name, f"{c5.name} {c6.name}"
+
+
 if __name__ == "__main__":
     test_partial_cross_section()
     # f = partial(gf.cross_section.strip, width=0.2)